@@ -0,0 +1,237 @@
+"""In-process TTL cache for upstream GET results, with a stale fallback.
+
+Category lists, group metadata and the WFS boundary layers change a few times
+a year at most, and the CKAN catalog not much more often. Re-fetching them on
+every tool call spends hundreds of milliseconds on an answer we already have.
+``cached(ttl)`` wraps an async fetch function so that a repeat call within
+``ttl`` seconds is answered from memory without touching the network. ``ttl``
+is either a number or a function of the call's arguments, for callers whose
+data moves at different speeds per endpoint (``ckan_request``).
+
+Expired entries are kept, not dropped: when the refetch fails because the
+upstream is *unavailable* — a 5xx, a 429, a network error or timeout, or the
+retry budget running out — the last good answer is served instead and the
+failure is logged. An answer that is a statement about the request (any other
+4xx, a CKAN ``success: false``) is never covered up by an old one; it
+propagates as before. Failures are never cached.
+
+A function cached with a ``stale_while_revalidate`` window answers a call
+that arrives within that many seconds after expiry from the expired entry
+straight away and refreshes it in the background, so the first call after
+expiry no longer pays the round-trip; only a call later than the window waits
+for the fetch. A background refresh that fails because the upstream is
+unavailable leaves the entry as it was; one that fails with an answer about
+the request evicts it, so the next call sees that error instead of the old
+value.
+
+Bounded: at most ``MAX_ENTRIES`` entries, least recently used evicted first.
+Concurrent identical calls are coalesced — the first starts the fetch and the
+others await the same one, so a burst of identical tool calls costs one
+upstream request, not one each.
+
+The cache holds the decoded object the wrapped function returned and hands
+the *same* object to every caller. Callers treat results as read-only; a
+caller that needs to modify one must copy it first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, ParamSpec, TypeVar
+
+import httpx
+import orjson
+
+from .retry import UpstreamUnavailableError
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# TTL policies, in seconds. Short for data that moves (catalog searches and
+# datastore queries), long for reference data that practically does not.
+TTL_SHORT = 60
+TTL_NORMAL = 300
+TTL_LONG = 3600
+
+# Decoded JSON takes several times its wire size in Python objects. A typical
+# CKAN answer (a search page, a dataset, a datastore page) is tens of KB on
+# the wire and a few hundred KB decoded, so 128 entries stay around 50 MB at
+# worst — still far more distinct calls than a session makes. Functions with
+# much larger answers (WFS layers, Paris trees, tourism categories) get their
+# own, smaller ``max_entries`` on top, so they cannot fill this budget alone.
+MAX_ENTRIES = 128
+
+# key -> (value, monotonic expiry, monotonic fetch time), in LRU order.
+# Expired entries stay as stale fallback until evicted.
+_cache: OrderedDict[str, tuple[Any, float, float]] = OrderedDict()
+
+# key -> the fetch currently running for it, awaited by every concurrent caller.
+_inflight: dict[str, asyncio.Task[Any]] = {}
+
+_stats = {
+    "hits": 0,
+    "misses": 0,
+    "coalesced": 0,
+    "stale": 0,
+    "revalidations": 0,
+    "evictions": 0,
+}
+
+
+def clear_cache() -> None:
+    """Drop all cached responses and reset the counters (used by tests)."""
+    _cache.clear()
+    _inflight.clear()
+    for name in _stats:
+        _stats[name] = 0
+
+
+def cache_stats() -> dict[str, int]:
+    """Counters since start (or the last ``clear_cache()``), plus the size.
+
+    ``hits`` were answered from a fresh entry, ``misses`` started a fetch,
+    ``coalesced`` joined a fetch already running, ``stale`` were answered
+    from an expired entry because the upstream was unavailable,
+    ``revalidations`` from an expired entry inside the
+    stale-while-revalidate window while a background refresh ran.
+    """
+    return {**_stats, "size": len(_cache)}
+
+
+def _is_unavailable(exc: BaseException) -> bool:
+    """Whether ``exc`` says the upstream is down rather than the request wrong."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return isinstance(exc, httpx.RequestError | UpstreamUnavailableError)
+
+
+def _make_key(name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    # Sorted keys, so that {"a": 1, "b": 2} and {"b": 2, "a": 1} share an entry.
+    return name + orjson.dumps([args, kwargs], option=orjson.OPT_SORT_KEYS).decode()
+
+
+def _store(key: str, value: Any, ttl: float, prefix: str, max_entries: int | None) -> None:
+    now = time.monotonic()
+    _cache[key] = (value, now + ttl, now)
+    _cache.move_to_end(key)
+    if max_entries is not None:
+        # A linear scan, but over at most MAX_ENTRIES keys and only on a store,
+        # i.e. after a network round-trip.
+        own = [k for k in _cache if k.startswith(prefix)]
+        for oldest in own[: max(0, len(own) - max_entries)]:
+            del _cache[oldest]
+            _stats["evictions"] += 1
+    if len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+        _stats["evictions"] += 1
+
+
+def _forget(key: str, task: asyncio.Task[Any]) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # Mark the exception retrieved: if every caller was cancelled meanwhile,
+    # nobody else will, and asyncio would log it as never retrieved.
+    if not task.cancelled():
+        task.exception()
+
+
+def _evict_if_rejected(key: str, task: asyncio.Task[Any]) -> None:
+    # Done-callback of a background refresh: a 4xx or CKAN error must not stay
+    # hidden behind the entry being revalidated.
+    exc = None if task.cancelled() else task.exception()
+    if exc is not None and not _is_unavailable(exc):
+        _cache.pop(key, None)
+        logger.warning(
+            "background refresh of %s failed (%s: %s); dropped the cached answer",
+            key,
+            type(exc).__name__,
+            str(exc) or "no further detail",
+        )
+
+
+def cached(
+    ttl: float | Callable[..., float],
+    stale_while_revalidate: float = 0,
+    max_entries: int | None = None,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Cache an async fetch function's results for ``ttl`` seconds.
+
+    Arguments must be JSON-serialisable; they form the cache key together
+    with the function's qualified name. A callable ``ttl`` is called with the
+    same arguments as the wrapped function. For ``stale_while_revalidate``
+    seconds after expiry an entry is still served, with a refresh started in
+    the background. ``max_entries`` caps this function's share of the cache,
+    least recently used of its entries evicted first.
+    """
+
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        name = f"{fn.__module__}.{fn.__qualname__}"
+        # Keys are the name followed by a JSON array, so "<name>[" matches this
+        # function's entries and no other function whose name extends it.
+        prefix = name + "["
+
+        async def fetch(key: str, seconds: float, *args: P.args, **kwargs: P.kwargs) -> R:
+            value = await fn(*args, **kwargs)
+            _store(key, value, seconds, prefix, max_entries)
+            return value
+
+        def start(key: str, *args: P.args, **kwargs: P.kwargs) -> asyncio.Task[R]:
+            seconds = ttl(*args, **kwargs) if callable(ttl) else ttl
+            task = asyncio.ensure_future(fetch(key, seconds, *args, **kwargs))
+            _inflight[key] = task
+            task.add_done_callback(functools.partial(_forget, key))
+            return task
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = _make_key(name, args, kwargs)
+            entry = _cache.get(key)
+            if entry is not None:
+                now = time.monotonic()
+                if entry[1] > now:
+                    _cache.move_to_end(key)
+                    _stats["hits"] += 1
+                    return entry[0]
+                if entry[1] + stale_while_revalidate > now:
+                    _cache.move_to_end(key)
+                    _stats["revalidations"] += 1
+                    if key not in _inflight:
+                        refresh = start(key, *args, **kwargs)
+                        refresh.add_done_callback(functools.partial(_evict_if_rejected, key))
+                    return entry[0]
+
+            task = _inflight.get(key)
+            if task is None:
+                _stats["misses"] += 1
+                task = start(key, *args, **kwargs)
+            else:
+                _stats["coalesced"] += 1
+
+            try:
+                # Shielded: one caller giving up must not cancel the fetch the
+                # others are waiting on.
+                return await asyncio.shield(task)
+            except Exception as e:
+                if entry is None or not _is_unavailable(e):
+                    raise
+                _stats["stale"] += 1
+                logger.warning(
+                    "%s failed (%s: %s); serving the cached answer from %.0fs ago",
+                    name,
+                    type(e).__name__,
+                    str(e) or "no further detail",
+                    time.monotonic() - entry[2],
+                )
+                return entry[0]
+
+        return wrapper
+
+    return decorator
@@ -5,11 +5,17 @@ from __future__ import annotations
 # stdlib ElementTree only for the Element type; parsing goes through
 # defusedxml, which rejects DTDs/entity expansion (billion laughs) and
 # external entity references in upstream XML.
+#
+# Not lxml, although it parses faster: a search returns at most 100 hits
+# (tens of KB), so parse time is lost in the round-trip, and lxml's default
+# parser resolves entities — its hardening would have to be rebuilt by hand
+# (resolve_entities=False, no_network=True) and kept in step with defusedxml.
 import xml.etree.ElementTree as ET
 
 from defusedxml import ElementTree as DefusedET
 
-from ..config import PARIS_API_URL
+from ..cache import TTL_LONG, cached
+from ..config import PARIS_API_URL, PARIS_NAMESPACES
 from ..http_client import http_get
 
 
@@ -21,13 +27,21 @@ def cql_escape(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"')
 
 
+# A 100-hit search parses into an element tree of a few MB; 16 of them cover
+# the back-and-forth of one session's parliament questions.
+@cached(TTL_LONG, max_entries=16)
 async def paris_search(
     index: str,
     cql_query: str,
     start: int = 1,
     max_results: int = 10,
 ) -> ET.Element:
-    """Search the Paris parliamentary information API."""
+    """Search the Paris parliamentary information API.
+
+    Cached for ``TTL_LONG``: business items and mandates change with council
+    sessions, not by the minute. The returned tree is shared between callers
+    and must not be modified.
+    """
     url = f"{PARIS_API_URL}/{index}/searchdetails"
     params = {
         "q": cql_query,
@@ -39,6 +53,21 @@ async def paris_search(
     return DefusedET.fromstring(response.content)
 
 
+def paris_path(path: str) -> str:
+    """Expand the ``prefix:Tag`` steps of an ElementPath into Clark notation.
+
+    ``"g:Beginn/g:Text"`` becomes ``"{http://…/Geschaeft}Beginn/{…}Text"``.
+    Meant to run once at import: a prefixed path passed together with a
+    namespace map is re-keyed (the map sorted) on every ``find()``, whereas a
+    single Clark-notation step takes ElementTree's C fast path outright.
+    """
+    steps = []
+    for step in path.split("/"):
+        prefix, sep, local = step.partition(":")
+        steps.append(f"{{{PARIS_NAMESPACES[prefix]}}}{local}" if sep else step)
+    return "/".join(steps)
+
+
 def paris_extract_text(element: ET.Element | None, default: str = "") -> str:
     """Safely extract text from an XML element."""
     if element is not None and element.text:
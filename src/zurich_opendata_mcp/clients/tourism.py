@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
-from ..config import ZT_API_URL
+from ..cache import TTL_LONG, cached
+from ..config import ZT_API_URL, ZT_CATEGORIES
 from ..http_client import http_get_json
 
+# Request URLs of the named categories, built once. Numeric IDs outside this
+# set (the tool accepts any) are formatted per call.
+_ZT_URLS_BY_ID: dict[int, str] = {cid: f"{ZT_API_URL}?id={cid}" for cid in ZT_CATEGORIES.values()}
 
+
+@cached(TTL_LONG)
 async def zt_get_categories() -> list[dict]:
     """Get all Zürich Tourismus categories."""
     return await http_get_json(ZT_API_URL)
 
 
+# A category decodes to a few MB of Schema.org items. 12 holds exactly the
+# named categories, so category="all" does not evict its own entries.
+@cached(TTL_LONG, max_entries=len(ZT_CATEGORIES))
 async def zt_get_data(category_id: int) -> list[dict]:
     """Get data for a specific ZT category."""
-    return await http_get_json(f"{ZT_API_URL}?id={category_id}")
+    url = _ZT_URLS_BY_ID.get(category_id) or f"{ZT_API_URL}?id={category_id}"
+    return await http_get_json(url)
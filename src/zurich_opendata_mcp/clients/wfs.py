@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any
 
-from ..config import WFS_BASE_URL
-from ..http_client import http_get
+from ..cache import TTL_NORMAL, cached
+from ..config import GEOPORTAL_LAYERS, WFS_BASE_URL
+from ..http_client import http_get_json
 
+# The request-invariant part of every GetFeature query; read-only so no call
+# can leak a key into the next one.
+_WFS_BASE_PARAMS = MappingProxyType(
+    {
+        "service": "WFS",
+        "version": "1.1.0",
+        "request": "GetFeature",
+    }
+)
 
+# Service URLs of the registered layers, built once. Other service names (the
+# function is public) are formatted per call.
+_SERVICE_URLS: dict[str, str] = {
+    service: f"{WFS_BASE_URL}/{service}" for service, _, _ in GEOPORTAL_LAYERS.values()
+}
+
+
+# A 500-feature polygon layer is megabytes on the wire and several times that
+# decoded, so only a handful of layers are held at once.
+@cached(TTL_NORMAL, max_entries=4)
 async def wfs_get_features(
     service_name: str,
     typename: str,
@@ -21,11 +42,9 @@ async def wfs_get_features(
     plural ``typenames``), and the Stadt Zürich Geoserver still serves 1.1.0
     layers under the names listed in ``GEOPORTAL_LAYERS``.
     """
-    url = f"{WFS_BASE_URL}/{service_name}"
+    url = _SERVICE_URLS.get(service_name) or f"{WFS_BASE_URL}/{service_name}"
     params: dict[str, str] = {
-        "service": "WFS",
-        "version": "1.1.0",
-        "request": "GetFeature",
+        **_WFS_BASE_PARAMS,
         "typename": typename,
         "outputFormat": output_format,
         "maxFeatures": str(max_features),
@@ -33,5 +52,22 @@ async def wfs_get_features(
     if cql_filter:
         params["CQL_FILTER"] = cql_filter
 
-    response = await http_get(url, params=params)
-    return response.json()
+    return await http_get_json(url, params=params)
+
+
+async def wfs_get_layer(
+    layer_id: str,
+    max_features: int = 50,
+    cql_filter: str | None = None,
+) -> dict[str, Any]:
+    """Fetch the features of a layer registered in ``GEOPORTAL_LAYERS``.
+
+    Raises ``KeyError`` for an unknown ``layer_id``; callers validate first.
+    """
+    service_name, typename, _ = GEOPORTAL_LAYERS[layer_id]
+    return await wfs_get_features(
+        service_name=service_name,
+        typename=typename,
+        max_features=max_features,
+        cql_filter=cql_filter,
+    )
@@ -14,6 +14,9 @@ ZT_API_URL = "https://www.zuerich.com/en/api/v2/data"
 SPARQL_URL = "https://ld.stadt-zuerich.ch/query"
 
 REQUEST_TIMEOUT = 30.0
+# A TCP/TLS handshake to these hosts takes well under a second; an unreachable
+# host should fail (and be retried) after seconds, not after the full 30s.
+CONNECT_TIMEOUT = 5.0
 
 try:
     _PACKAGE_VERSION = version("zurich-opendata-mcp")
@@ -2,23 +2,39 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
 import httpx
+import orjson
 
 from .config import CKAN_BASE_URL
 from .models import DatasetSummary, ResourceInfo
 
 logger = logging.getLogger(__name__)
 
+# Readable messages for the HTTP statuses a caller can act on; every other
+# status falls back to "HTTP-Fehler <status>".
+_HTTP_STATUS_MESSAGES: dict[int, str] = {
+    403: "Zugriff verweigert.",
+    404: "Ressource nicht gefunden. Bitte ID/Name prüfen.",
+    429: "Zu viele Anfragen. Bitte warten.",
+}
+
 FORMAT_FIELD_DESC = "Ausgabeformat: 'markdown' (Standard, lesbar) oder 'json' (maschinenlesbar)."
 
 
 def json_out(payload: Any) -> str:
-    """Serialise a tool payload for ``format='json'`` output."""
-    return json.dumps(payload, indent=2, ensure_ascii=False, default=str)
+    """Serialise a tool payload for ``format='json'`` output.
+
+    Pretty-printed UTF-8 (no ``\\u`` escapes), anything non-JSON rendered via
+    ``str()``. orjson rather than ``json.dumps``: the payloads are record
+    lists of up to several hundred rows and GeoJSON, where it is several
+    times faster.
+    """
+    return orjson.dumps(
+        payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+    ).decode()
 
 
 def to_resource_info(resource: dict[str, Any]) -> ResourceInfo:
@@ -120,13 +136,7 @@ def handle_api_error(e: Exception, context: str = "") -> str:
     prefix = f"Fehler bei {context}: " if context else "Fehler: "
     if isinstance(e, httpx.HTTPStatusError):
         status = e.response.status_code
-        if status == 404:
-            return f"{prefix}Ressource nicht gefunden. Bitte ID/Name prüfen."
-        elif status == 403:
-            return f"{prefix}Zugriff verweigert."
-        elif status == 429:
-            return f"{prefix}Zu viele Anfragen. Bitte warten."
-        return f"{prefix}HTTP-Fehler {status}"
+        return prefix + _HTTP_STATUS_MESSAGES.get(status, f"HTTP-Fehler {status}")
     elif isinstance(e, httpx.TimeoutException):
         return f"{prefix}Zeitüberschreitung. Bitte erneut versuchen."
     return f"{prefix}{type(e).__name__}: {e}"
@@ -11,6 +11,9 @@ multiply rather than add.
 
 All requests are idempotent GETs against public APIs, so a retry is always
 safe. What is retried, how fast and how long is documented in ``retry.py``.
+
+Caching: ``ckan_request`` answers repeats from the TTL cache in ``cache.py``,
+which also serves the last good answer while the upstream is unavailable.
 """
 
 from __future__ import annotations
@@ -19,8 +22,10 @@ import asyncio
 from typing import Any
 
 import httpx
+import orjson
 
-from .config import CKAN_API_URL, REQUEST_TIMEOUT, USER_AGENT
+from .cache import TTL_LONG, TTL_NORMAL, TTL_SHORT, cached
+from .config import CKAN_API_URL, CONNECT_TIMEOUT, REQUEST_TIMEOUT, USER_AGENT
 from .retry import fetch_with_retry
 
 # Exactly one level may retry, and it is `retry.fetch_with_retry`. httpx
@@ -28,6 +33,17 @@ from .retry import fetch_with_retry
 # stacked under our own loop that is 3 x 4 attempts, not 3 + 4.
 CONNECT_RETRIES = 0
 
+# Keep-alive pool sizing. A single tool call fans out to at most a couple of
+# dozen requests (zurich_find_school_data, zurich_analyze_datasets), nearly all
+# against data.stadt-zuerich.ch, so 20 idle connections cover a full fan-out
+# and the next call finds them warm. Set on the transport, not the client: once
+# `transport=` is passed, httpx ignores the client's own `limits=` silently.
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=30.0,
+)
+
 # Pooled connections are bound to the event loop they were opened on, so the
 # client is recreated whenever the running loop changes. The server only ever
 # runs one loop; a loop change happens only in test suites, where each test
@@ -46,10 +62,20 @@ def get_client() -> httpx.AsyncClient:
     loop = asyncio.get_running_loop()
     if _client is None or _client.is_closed or _client_loop is not loop:
         _client = httpx.AsyncClient(
-            timeout=REQUEST_TIMEOUT,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+            # No Accept-Encoding here on purpose: httpx already sends
+            # "gzip, deflate" and decodes transparently (plus br/zstd when
+            # brotli/zstandard are importable). GeoJSON compresses well, and
+            # gzip takes most of that; br would add a dependency for a few %.
             headers={"User-Agent": USER_AGENT},
             follow_redirects=True,
-            transport=httpx.AsyncHTTPTransport(retries=CONNECT_RETRIES),
+            # HTTP/2 lets the concurrent fan-outs (asyncio.gather over CKAN)
+            # share one multiplexed connection per host instead of opening a
+            # connection each. Negotiated via ALPN; hosts that only speak
+            # HTTP/1.1 fall back transparently.
+            transport=httpx.AsyncHTTPTransport(
+                retries=CONNECT_RETRIES, limits=POOL_LIMITS, http2=True
+            ),
         )
         _client_loop = loop
     return _client
@@ -79,23 +105,92 @@ async def http_get(url: str, params: dict[str, Any] | None = None) -> httpx.Resp
     return await fetch_with_retry(get_client(), url, params=params)
 
 
+# Response cache lifetime per CKAN action; anything not listed gets TTL_SHORT.
+# Groups and tags change with the catalog's structure, a few times a year;
+# datastore rows include the hourly measurement series, so they stay short.
+CKAN_TTLS: dict[str, float] = {
+    "group_list": TTL_LONG,
+    "group_show": TTL_LONG,
+    "tag_list": TTL_LONG,
+    "package_show": TTL_NORMAL,
+    "datastore_search": 30,
+    "datastore_search_sql": 30,
+}
+
+
+def _ckan_ttl(action: str, params: dict[str, Any] | None = None) -> float:
+    # A `limit: 0` datastore_search is a schema probe (fields and row count,
+    # no rows — zurich_analyze_datasets), and a resource's schema is as
+    # stable as the catalog structure.
+    if action == "datastore_search" and params and params.get("limit") == 0:
+        return TTL_LONG
+    return CKAN_TTLS.get(action, TTL_SHORT)
+
+
+async def ckan_request_uncached(action: str, params: dict[str, Any] | None = None) -> Any:
+    """``ckan_request`` without the response cache.
+
+    For callers that keep their own cache policy on top of the answer
+    (``resolver.py``) and must see the upstream's current state.
+    """
+    response = await http_get(f"{CKAN_API_URL}/{action}", params=params or {})
+    data = orjson.loads(response.content)
+
+    # CKAN sets either `result` (success) or `error` (failure), never both,
+    # so the common case is a single lookup and `success` need not be read.
+    try:
+        return data["result"]
+    except KeyError:
+        error_msg = data.get("error", {}).get("message", "Unknown CKAN error")
+        raise RuntimeError(f"CKAN API error: {error_msg}") from None
+
+
+# For a minute past expiry an entry is still answered at once while it is
+# refetched in the background: an agent re-asking the same question mid-session
+# gets the cached latency, at the price of data at most a minute older.
+@cached(_ckan_ttl, stale_while_revalidate=TTL_SHORT)
 async def ckan_request(action: str, params: dict[str, Any] | None = None) -> Any:
     """Make a CKAN API request and return the ``result`` field.
 
     Typed ``Any`` on purpose: CKAN returns a dict for most actions but a
     plain list for e.g. ``group_list``/``tag_list``.
+
+    Results are cached per ``CKAN_TTLS`` (see ``cache.py``), revalidated in
+    the background for ``TTL_SHORT`` past expiry, and shared between
+    callers — treat them as read-only.
     """
-    response = await http_get(f"{CKAN_API_URL}/{action}", params=params or {})
-    data = response.json()
+    return await ckan_request_uncached(action, params)
+
+
+async def ckan_batch(
+    action: str,
+    params_list: list[dict[str, Any]],
+    concurrency: int = 10,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Run the same CKAN ``action`` once per params dict, concurrently.
+
+    At most ``concurrency`` requests are in flight at once, so a long list
+    does not burst the portal. Results come back in the order of
+    ``params_list``. The first failure propagates, as a sequential loop
+    would — unless ``return_exceptions`` is set, in which case a failed
+    request yields its exception in its slot and the others still count.
+    """
+    sem = asyncio.Semaphore(concurrency)
 
-    if not data.get("success"):
-        error_msg = data.get("error", {}).get("message", "Unknown CKAN error")
-        raise RuntimeError(f"CKAN API error: {error_msg}")
+    async def one(params: dict[str, Any]) -> Any:
+        async with sem:
+            return await ckan_request(action, params)
 
-    return data["result"]
+    return await asyncio.gather(*(one(p) for p in params_list), return_exceptions=return_exceptions)
 
 
 async def http_get_json(url: str, params: dict[str, Any] | None = None) -> Any:
-    """Generic JSON GET request for non-CKAN APIs."""
+    """Generic JSON GET request for non-CKAN APIs.
+
+    Decodes with orjson rather than ``response.json()``: WFS GeoJSON runs to
+    hundreds of KB of coordinates, where the stdlib decoder is several times
+    slower. JSON on the wire is UTF-8 (RFC 8259), which is all orjson reads.
+    """
     response = await http_get(url, params=params)
-    return response.json()
+    return orjson.loads(response.content)
@@ -13,6 +13,8 @@ looks up the right resource in the dataset's resource list at call time:
 
 Successful lookups are cached in-process for ``CACHE_TTL_SECONDS`` to avoid
 an extra CKAN round-trip on every tool call; failures are never cached.
+The lookup bypasses the response cache in ``cache.py`` (it has its own), so
+a failed or unmatched lookup is retried against CKAN on the very next call.
 """
 
 from __future__ import annotations
@@ -23,7 +25,7 @@ import time
 from datetime import UTC, datetime
 from typing import Any
 
-from .http_client import ckan_request
+from .http_client import ckan_request_uncached
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +71,7 @@ async def resolve_yearly_resource(dataset_slug: str, name_prefix: str, fallback_
         return cached[0]
 
     try:
-        dataset = await ckan_request("package_show", {"id": dataset_slug})
+        dataset = await ckan_request_uncached("package_show", {"id": dataset_slug})
         resource_id = _pick_yearly_resource(
             dataset.get("resources", []),
             name_prefix,
@@ -3,22 +3,25 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 from typing import Annotated
 
 from mcp.types import CallToolResult, ToolAnnotations
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..app import mcp
-from ..config import CKAN_BASE_URL, ZURICH_GROUPS, ZurichGroup
+from ..config import CKAN_BASE_URL, ZURICH_GROUPS, OutputFormat, ZurichGroup
 from ..formatters import (
+    FORMAT_FIELD_DESC,
     format_dataset_summary,
     format_resource_info,
     handle_api_error,
+    json_out,
     render_dataset_summary,
     to_dataset_summary,
     to_resource_info,
 )
-from ..http_client import ckan_request
+from ..http_client import ckan_batch, ckan_request
 from ..models import (
     AnalysisResult,
     DatasetAnalysis,
@@ -373,7 +376,9 @@ async def zurich_analyze_datasets(
         # extra package_show call has been removed.
         fields_per_ds: list[tuple[list[dict], int] | None]
         if params.include_structure:
-            sem = asyncio.Semaphore(5)
+            # Bounded below POOL_LIMITS' 20 keep-alive connections, so the
+            # fan-out reuses warm connections instead of opening new ones.
+            sem = asyncio.Semaphore(8)
 
             async def _fetch_first_datastore_fields(
                 resources: list[dict],
@@ -422,18 +427,27 @@ async def zurich_analyze_datasets(
                 url=f"{CKAN_BASE_URL}/dataset/{name}",
             )
 
-            lines.append(f"### {i}. {title}")
-            lines.append(f"- **ID**: `{name}`")
-            lines.append(f"- **Formate**: {', '.join(formats)}")
-            lines.append(f"- **Ressourcen**: {len(resources)}")
-
-            for res in resources:
-                ds_active = "✔ DataStore" if res.datastore_active else ""
-                lines.append(f"  - `{res.id}` — {res.name} ({res.format}) {ds_active}")
+            lines.extend(
+                (
+                    f"### {i}. {title}",
+                    f"- **ID**: `{name}`",
+                    f"- **Formate**: {', '.join(formats)}",
+                    f"- **Ressourcen**: {len(resources)}",
+                )
+            )
+            lines.extend(
+                f"  - `{res.id}` — {res.name} ({res.format}) "
+                + ("✔ DataStore" if res.datastore_active else "")
+                for res in resources
+            )
 
             if params.include_freshness:
-                lines.append(f"- **Letzte Änderung**: {modified}")
-                lines.append(f"- **Aktualisierung**: {', '.join(interval)}")
+                lines.extend(
+                    (
+                        f"- **Letzte Änderung**: {modified}",
+                        f"- **Aktualisierung**: {', '.join(interval)}",
+                    )
+                )
 
             if params.include_structure and fields_info is not None:
                 fields, total_records = fields_info
@@ -444,8 +458,12 @@ async def zurich_analyze_datasets(
                     if f["id"] != "_id"
                 ]
                 field_list = [f"`{fi.id}` ({fi.type})" for fi in analysis.fields]
-                lines.append(f"- **DataStore-Einträge**: {total_records:,}")
-                lines.append(f"- **Felder**: {', '.join(field_list[:15])}")
+                lines.extend(
+                    (
+                        f"- **DataStore-Einträge**: {total_records:,}",
+                        f"- **Felder**: {', '.join(field_list[:15])}",
+                    )
+                )
                 if len(field_list) > 15:
                     lines.append(f"  *(und {len(field_list) - 15} weitere)*")
 
@@ -526,7 +544,7 @@ async def zurich_catalog_stats() -> str:
                 items = fmts.get("items", [])
             else:
                 items = fmts if isinstance(fmts, list) else []
-            for item in sorted(items, key=lambda x: x.get("count", 0), reverse=True)[:10]:
+            for item in heapq.nlargest(10, items, key=lambda x: x.get("count", 0)):
                 lines.append(
                     f"- **{item.get('display_name', item.get('name', '?'))}**: {item.get('count', 0)}"
                 )
@@ -537,6 +555,15 @@ async def zurich_catalog_stats() -> str:
         return handle_api_error(e, "Katalog-Statistiken")
 
 
+_SCHOOL_SUMMARIES = 10
+_SCHOOL_ONE_LINERS = 15
+
+
+def _format_dataset_one_liner(ds: dict) -> str:
+    """One Markdown list line per dataset: title, ID and author."""
+    return f"- **{ds['title']}** (`{ds['name']}`) – {ds.get('author', '?')}"
+
+
 class FindSchoolDataInput(BaseModel):
     """Input für schulspezifische Datensuche."""
 
@@ -550,6 +577,7 @@ class FindSchoolDataInput(BaseModel):
             "Wenn leer, werden alle schulrelevanten Datensätze gesucht."
         ),
     )
+    format: OutputFormat = Field(default="markdown", description=FORMAT_FIELD_DESC)
 
 
 @mcp.tool(
@@ -590,25 +618,31 @@ async def zurich_find_school_data(params: FindSchoolDataInput) -> str:
         if params.topic:
             search_terms = [params.topic] + search_terms[:4]
 
-        # Multiple queries, merge unique results (Zurich Solr doesn't handle long OR chains well)
-        seen_ids: set[str] = set()
-        datasets: list[dict] = []
-        for term in search_terms:
-            result = await ckan_request(
-                "package_search", {"q": term, "rows": 15, "sort": "score desc"}
-            )
-            for ds in result["results"]:
-                if ds["name"] not in seen_ids:
-                    seen_ids.add(ds["name"])
-                    datasets.append(ds)
+        # Multiple queries, merge unique results (Zurich Solr doesn't handle long OR chains well).
+        # Issued concurrently; results keep the term order, so the merge does too.
+        # One failed term only drops its own hits, and is named in the answer;
+        # if every term failed there is nothing to show, and the first error
+        # is the answer.
+        results = await ckan_batch(
+            "package_search",
+            [{"q": term, "rows": 15, "sort": "score desc"} for term in search_terms],
+            return_exceptions=True,
+        )
+        succeeded = [r for r in results if not isinstance(r, BaseException)]
+        if not succeeded:
+            raise results[0]
+        failed_terms = [
+            term
+            for term, r in zip(search_terms, results, strict=True)
+            if isinstance(r, BaseException)
+        ]
+        # Dedup by dataset name in one pass; a dict keeps first-seen order.
+        # A name seen twice is the same package from two searches.
+        unique = {ds["name"]: ds for result in succeeded for ds in result["results"]}
+        datasets: list[dict] = list(unique.values())
 
         total = len(datasets)
 
-        lines = [
-            "## Schulrelevante Datensätze",
-            f"**{total} Treffer** (zeige {len(datasets)})\n",
-        ]
-
         # Group by author relevance
         schulamt_ds = []
         other_ds = []
@@ -619,16 +653,44 @@ async def zurich_find_school_data(params: FindSchoolDataInput) -> str:
             else:
                 other_ds.append(ds)
 
+        if params.format == "json":
+            return json_out(
+                {
+                    "total": total,
+                    "failed_terms": failed_terms,
+                    "schulamt": [to_dataset_summary(ds).model_dump() for ds in schulamt_ds],
+                    "weitere": [to_dataset_summary(ds).model_dump() for ds in other_ds],
+                }
+            )
+
+        # Full summaries only for the first few Schulamt datasets; the rest of
+        # the list is one line per dataset.
+        shown_schulamt = schulamt_ds[:_SCHOOL_SUMMARIES]
+        shown_other = other_ds[:_SCHOOL_ONE_LINERS]
+
+        lines = [
+            "## Schulrelevante Datensätze",
+            f"**{total} Treffer** (zeige {len(shown_schulamt) + len(shown_other)})\n",
+        ]
+        if failed_terms:
+            lines.append(
+                f"⚠️ Suche fehlgeschlagen für: {', '.join(failed_terms)} – "
+                "deren Treffer fehlen in der Liste.\n"
+            )
+
         if schulamt_ds:
             lines.append("### Vom Schulamt / SSD")
-            for ds in schulamt_ds:
+            for ds in shown_schulamt:
                 lines.append(format_dataset_summary(ds))
                 lines.append("")
+            if len(schulamt_ds) > len(shown_schulamt):
+                lines.append(f"*… und {len(schulamt_ds) - len(shown_schulamt)} weitere*\n")
 
         if other_ds:
             lines.append("### Weitere relevante Datensätze")
-            for ds in other_ds[:15]:
-                lines.append(f"- **{ds['title']}** (`{ds['name']}`) – {ds.get('author', '?')}")
+            lines.extend(_format_dataset_one_liner(ds) for ds in shown_other)
+            if len(other_ds) > len(shown_other):
+                lines.append(f"*… und {len(other_ds) - len(shown_other)} weitere*")
 
         return "\n".join(lines)
 
@@ -9,7 +9,7 @@ from mcp.types import ToolAnnotations
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..app import mcp
-from ..formatters import handle_api_error
+from ..formatters import handle_api_error, json_out
 from ..http_client import ckan_request
 
 
@@ -120,7 +120,7 @@ async def zurich_datastore_query(params: DatastoreQueryInput) -> str:
             "\n".join(field_info),
             "\n### Daten\n",
             "```json",
-            json.dumps(records[: params.limit], indent=2, ensure_ascii=False, default=str),
+            json_out(records[: params.limit]),
             "```",
         ]
 
@@ -185,7 +185,7 @@ async def zurich_datastore_sql(params: DatastoreSqlInput) -> str:
             f"## SQL-Ergebnis: {len(records)} Zeilen",
             f"**Spalten**: {', '.join(field_names)}\n",
             "```json",
-            json.dumps(records, indent=2, ensure_ascii=False, default=str),
+            json_out(records),
             "```",
         ]
         return "\n".join(lines)
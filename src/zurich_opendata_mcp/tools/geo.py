@@ -2,15 +2,91 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from mcp.types import ToolAnnotations
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..app import mcp
-from ..clients.wfs import wfs_get_features
+from ..clients.wfs import wfs_get_layer
 from ..config import GEOPORTAL_LAYERS, GeoLayerId, OutputFormat
 from ..formatters import FORMAT_FIELD_DESC, handle_api_error, json_out
 
 
+def _validate_cql_filter(cql: str) -> str | None:
+    # Local shape check before the WFS round-trip: an unterminated literal or
+    # unbalanced parenthesis is a guaranteed 400 from GeoServer, answered only
+    # after a full RTT, and as an XML exception report rather than a message a
+    # user can act on. Not a CQL parser — GeoServer still has the last word.
+    # CQL literals are single-quoted and escape a quote by doubling it, so a
+    # literal is closed exactly when the quote count is even.
+    depth = 0
+    in_literal = False
+    for ch in cql:
+        if ch == "'":
+            in_literal = not in_literal
+        elif in_literal:
+            continue
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth < 0:
+                break
+    if in_literal:
+        return "Fehler: CQL-Filter enthält ein nicht geschlossenes Literal ('…')."
+    if depth != 0:
+        return "Fehler: CQL-Filter enthält unausgeglichene Klammern."
+    return None
+
+
+# Property names the layers use for a feature's label, in order of preference.
+_NAME_KEYS = ("name", "bezeichnung", "einheit")
+_CATEGORY_KEYS = ("kategorie", "typ")
+_ADDRESS_KEYS = ("adresse", "strasse")
+
+
+def _first(props: dict, keys: tuple[str, ...]) -> Any:
+    """The first non-empty value among ``keys`` in ``props``, or ``""``.
+
+    Returned as is: WFS properties may be numbers or booleans, not only text.
+    """
+    return next((value for key in keys if (value := props.get(key))), "")
+
+
+# GEOPORTAL_LAYERS is static, so the layer listing is rendered once at import.
+_SORTED_LAYERS = sorted(GEOPORTAL_LAYERS.items())
+
+_LAYERS_JSON = json_out(
+    {
+        "count": len(GEOPORTAL_LAYERS),
+        "layers": [
+            {
+                "layer_id": layer_id,
+                "description": desc,
+                "service": service,
+                "typename": typename,
+            }
+            for layer_id, (service, typename, desc) in _SORTED_LAYERS
+        ],
+    }
+)
+
+_LAYERS_MARKDOWN = "\n".join(
+    [
+        "## Verfügbare Geoportal-Layer (WFS)",
+        f"**Anzahl**: {len(GEOPORTAL_LAYERS)}\n",
+        "| Layer-ID | Beschreibung | WFS-Service |",
+        "|---|---|---|",
+        *(
+            f"| `{layer_id}` | {desc} | {service} |"
+            for layer_id, (service, _, desc) in _SORTED_LAYERS
+        ),
+        "\n*Nutze `zurich_geo_features` mit einer Layer-ID, um GeoJSON-Daten abzurufen.*",
+    ]
+)
+
+
 class GeoLayersInput(BaseModel):
     """Input für die Layer-Liste."""
 
@@ -41,33 +117,7 @@ async def zurich_geo_layers(params: GeoLayersInput | None = None) -> str:
         format='json')
     """
     params = params or GeoLayersInput()
-    if params.format == "json":
-        return json_out(
-            {
-                "count": len(GEOPORTAL_LAYERS),
-                "layers": [
-                    {
-                        "layer_id": layer_id,
-                        "description": desc,
-                        "service": service,
-                        "typename": typename,
-                    }
-                    for layer_id, (service, typename, desc) in sorted(GEOPORTAL_LAYERS.items())
-                ],
-            }
-        )
-
-    lines = [
-        "## Verfügbare Geoportal-Layer (WFS)",
-        f"**Anzahl**: {len(GEOPORTAL_LAYERS)}\n",
-        "| Layer-ID | Beschreibung | WFS-Service |",
-        "|---|---|---|",
-    ]
-    for layer_id, (service, typename, desc) in sorted(GEOPORTAL_LAYERS.items()):
-        lines.append(f"| `{layer_id}` | {desc} | {service} |")
-
-    lines.append("\n*Nutze `zurich_geo_features` mit einer Layer-ID, um GeoJSON-Daten abzurufen.*")
-    return "\n".join(lines)
+    return _LAYERS_JSON if params.format == "json" else _LAYERS_MARKDOWN
 
 
 class GeoFeaturesInput(BaseModel):
@@ -77,7 +127,7 @@ class GeoFeaturesInput(BaseModel):
 
     layer_id: GeoLayerId = Field(
         ...,
-        description=f"Layer-ID. Verfügbar: {', '.join(sorted(GEOPORTAL_LAYERS.keys()))}",
+        description=f"Layer-ID. Verfügbar: {', '.join(layer_id for layer_id, _ in _SORTED_LAYERS)}",
     )
     max_features: int = Field(
         default=50,
@@ -91,6 +141,7 @@ class GeoFeaturesInput(BaseModel):
             "CQL-Filter für Eigenschaften, z.B. \"kategorie = 'Kindergarten'\" "
             "oder \"name LIKE '%Wasser%'\". Feldnamen hängen vom Layer ab."
         ),
+        max_length=1000,
     )
     format: OutputFormat = Field(
         default="markdown",
@@ -123,11 +174,15 @@ async def zurich_geo_features(params: GeoFeaturesInput) -> str:
         # `layer_id` is a `Literal` matching GEOPORTAL_LAYERS.keys() (enforced
         # by Pydantic at validation time + a drift test in test_server.py),
         # so a missing key here would be a programming error, not user input.
-        service_name, typename, description = GEOPORTAL_LAYERS[params.layer_id]
+        if params.property_filter:
+            validation_error = _validate_cql_filter(params.property_filter)
+            if validation_error:
+                return validation_error
+
+        _, typename, description = GEOPORTAL_LAYERS[params.layer_id]
 
-        geojson = await wfs_get_features(
-            service_name=service_name,
-            typename=typename,
+        geojson = await wfs_get_layer(
+            params.layer_id,
             max_features=params.max_features,
             cql_filter=params.property_filter,
         )
@@ -156,14 +211,9 @@ async def zurich_geo_features(params: GeoFeaturesInput) -> str:
             geom_type = geom.get("type", "?")
             coords = geom.get("coordinates", [])
 
-            name = (
-                props.get("name")
-                or props.get("bezeichnung")
-                or props.get("einheit")
-                or f"Feature {i}"
-            )
-            kategorie = props.get("kategorie") or props.get("typ") or ""
-            adresse = props.get("adresse") or props.get("strasse") or ""
+            name = _first(props, _NAME_KEYS) or f"Feature {i}"
+            kategorie = _first(props, _CATEGORY_KEYS)
+            adresse = _first(props, _ADDRESS_KEYS)
 
             label = f"**{name}**"
             if kategorie:
@@ -10,11 +10,55 @@ from ..clients.paris import (
     cql_escape,
     paris_extract_text,
     paris_get_num_hits,
+    paris_path,
     paris_search,
 )
-from ..config import PARIS_NAMESPACES, OutputFormat
+from ..config import OutputFormat
 from ..formatters import FORMAT_FIELD_DESC, handle_api_error, json_out
 
+# Element paths in Clark notation, expanded once here instead of resolving the
+# namespace prefixes on every find() of every hit.
+_HIT = paris_path("sr:Hit")
+_G = {
+    key: paris_path(path)
+    for key, path in {
+        "geschaeft": "g:Geschaeft",
+        "gr_nr": "g:GRNr",
+        "erstunterzeichner": "g:Erstunterzeichner/g:KontaktGremium",
+        "name": "g:n",
+        "partei": "g:Partei",
+        "titel": "g:Titel",
+        "art": "g:Geschaeftsart",
+        "status": "g:Geschaeftsstatus",
+        "datum": "g:Beginn/g:Text",
+        "departement": "g:FederfuehrendesDepartement/g:Departement/g:n",
+    }.items()
+}
+_B = {
+    key: paris_path(path)
+    for key, path in {
+        "mandat": "b:Behordenmandat",
+        "name": "b:n",
+        "vorname": "b:Vorname",
+        "gremium": "b:Gremium",
+        "funktion": "b:Funktion",
+        "partei": "b:Partei",
+        "dauer": "b:Dauer/b:Text",
+    }.items()
+}
+_K = {
+    key: paris_path(path)
+    for key, path in {
+        "kontakt": "k:Kontakt",
+        "name_vorname": "k:NameVorname",
+        "partei": "k:Partei",
+        "wahlkreis": "k:Wahlkreis",
+        "mandate": "k:Behoerdenmandat/k:Behoerdenmandat",
+        "gremium": "k:GremiumName",
+        "funktion": "k:Funktion",
+    }.items()
+}
+
 
 def _build_geschaeft_cql(
     query: str,
@@ -48,54 +92,52 @@ def _build_behoerdenmandat_cql(
     return " AND ".join(cql_parts)
 
 
-def _geschaeft_record(geschaeft, ns) -> dict:
+def _geschaeft_record(geschaeft) -> dict:
     """Normalise one Paris Geschaeft XML element into a plain record."""
-    gr_nr = paris_extract_text(geschaeft.find("g:GRNr", ns), "?")
-    erst_el = geschaeft.find("g:Erstunterzeichner/g:KontaktGremium", ns)
+    gr_nr = paris_extract_text(geschaeft.find(_G["gr_nr"]), "?")
+    erst_el = geschaeft.find(_G["erstunterzeichner"])
     if erst_el is not None:
-        erst_name = paris_extract_text(erst_el.find("g:n", ns), "")
-        erst_partei = paris_extract_text(erst_el.find("g:Partei", ns), "")
+        erst_name = paris_extract_text(erst_el.find(_G["name"]), "")
+        erst_partei = paris_extract_text(erst_el.find(_G["partei"]), "")
         erstunterzeichner = f"{erst_name} ({erst_partei})" if erst_partei else erst_name
     else:
         erstunterzeichner = ""
     return {
         "gr_nr": gr_nr,
-        "titel": paris_extract_text(geschaeft.find("g:Titel", ns), "Ohne Titel"),
-        "art": paris_extract_text(geschaeft.find("g:Geschaeftsart", ns), "?"),
-        "status": paris_extract_text(geschaeft.find("g:Geschaeftsstatus", ns), "?"),
-        "datum": paris_extract_text(geschaeft.find("g:Beginn/g:Text", ns), "?"),
-        "departement": paris_extract_text(
-            geschaeft.find("g:FederfuehrendesDepartement/g:Departement/g:n", ns), ""
-        ),
+        "titel": paris_extract_text(geschaeft.find(_G["titel"]), "Ohne Titel"),
+        "art": paris_extract_text(geschaeft.find(_G["art"]), "?"),
+        "status": paris_extract_text(geschaeft.find(_G["status"]), "?"),
+        "datum": paris_extract_text(geschaeft.find(_G["datum"]), "?"),
+        "departement": paris_extract_text(geschaeft.find(_G["departement"]), ""),
         "erstunterzeichner": erstunterzeichner,
         "link": f"https://www.gemeinderat-zuerich.ch/geschaefte/{gr_nr.replace('/', '-')}",
     }
 
 
-def _behoerdenmandat_record(bm, ns) -> dict:
+def _behoerdenmandat_record(bm) -> dict:
     """Normalise one Behoerdenmandat XML element into a plain record."""
     return {
-        "name": paris_extract_text(bm.find("b:n", ns), "?"),
-        "vorname": paris_extract_text(bm.find("b:Vorname", ns), ""),
-        "gremium": paris_extract_text(bm.find("b:Gremium", ns), "?"),
-        "funktion": paris_extract_text(bm.find("b:Funktion", ns), "Mitglied"),
-        "partei": paris_extract_text(bm.find("b:Partei", ns), ""),
-        "dauer": paris_extract_text(bm.find("b:Dauer/b:Text", ns), "?"),
+        "name": paris_extract_text(bm.find(_B["name"]), "?"),
+        "vorname": paris_extract_text(bm.find(_B["vorname"]), ""),
+        "gremium": paris_extract_text(bm.find(_B["gremium"]), "?"),
+        "funktion": paris_extract_text(bm.find(_B["funktion"]), "Mitglied"),
+        "partei": paris_extract_text(bm.find(_B["partei"]), ""),
+        "dauer": paris_extract_text(bm.find(_B["dauer"]), "?"),
     }
 
 
-def _kontakt_record(kontakt, ns) -> dict:
+def _kontakt_record(kontakt) -> dict:
     """Normalise one Kontakt XML element into a plain record."""
     return {
-        "name_vorname": paris_extract_text(kontakt.find("k:NameVorname", ns), "?"),
-        "partei": paris_extract_text(kontakt.find("k:Partei", ns), ""),
-        "wahlkreis": paris_extract_text(kontakt.find("k:Wahlkreis", ns), ""),
+        "name_vorname": paris_extract_text(kontakt.find(_K["name_vorname"]), "?"),
+        "partei": paris_extract_text(kontakt.find(_K["partei"]), ""),
+        "wahlkreis": paris_extract_text(kontakt.find(_K["wahlkreis"]), ""),
         "mandate": [
             {
-                "gremium": paris_extract_text(m.find("k:GremiumName", ns), "?"),
-                "funktion": paris_extract_text(m.find("k:Funktion", ns), ""),
+                "gremium": paris_extract_text(m.find(_K["gremium"]), "?"),
+                "funktion": paris_extract_text(m.find(_K["funktion"]), ""),
             }
-            for m in kontakt.findall("k:Behoerdenmandat/k:Behoerdenmandat", ns)
+            for m in kontakt.findall(_K["mandate"])
         ],
     }
 
@@ -184,18 +226,17 @@ async def zurich_parliament_search(params: ParliamentSearchInput) -> str:
         root = await paris_search("geschaeft", cql, max_results=params.max_results)
         num_hits = paris_get_num_hits(root)
 
-        ns = PARIS_NAMESPACES
-        hits = root.findall("sr:Hit", ns)
+        hits = root.findall(_HIT)
 
         if not hits:
             return f"Keine Gemeinderatsgeschäfte gefunden für '{params.query}'."
 
         records = []
         for hit in hits:
-            geschaeft = hit.find("g:Geschaeft", ns)
+            geschaeft = hit.find(_G["geschaeft"])
             if geschaeft is None:
                 continue
-            records.append(_geschaeft_record(geschaeft, ns))
+            records.append(_geschaeft_record(geschaeft))
 
         if params.format == "json":
             return json_out(
@@ -280,8 +321,6 @@ async def zurich_parliament_members(params: ParliamentMembersInput) -> str:
         Markdown-Liste der gefundenen Ratsmitglieder
     """
     try:
-        ns = PARIS_NAMESPACES
-
         if params.commission:
             # Search via Behoerdenmandat index for commission members
             cql = _build_behoerdenmandat_cql(
@@ -292,17 +331,17 @@ async def zurich_parliament_members(params: ParliamentMembersInput) -> str:
 
             root = await paris_search("behoerdenmandat", cql, max_results=params.max_results)
             num_hits = paris_get_num_hits(root)
-            hits = root.findall("sr:Hit", ns)
+            hits = root.findall(_HIT)
 
             if not hits:
                 return f"Keine Mitglieder gefunden für Kommission '{params.commission}'."
 
             records = []
             for hit in hits:
-                bm = hit.find("b:Behordenmandat", ns)
+                bm = hit.find(_B["mandat"])
                 if bm is None:
                     continue
-                records.append(_behoerdenmandat_record(bm, ns))
+                records.append(_behoerdenmandat_record(bm))
 
             if params.format == "json":
                 return json_out(
@@ -345,17 +384,17 @@ async def zurich_parliament_members(params: ParliamentMembersInput) -> str:
 
             root = await paris_search("kontakt", cql, max_results=params.max_results)
             num_hits = paris_get_num_hits(root)
-            hits = root.findall("sr:Hit", ns)
+            hits = root.findall(_HIT)
 
             if not hits:
                 return "Keine Ratsmitglieder gefunden."
 
             records = []
             for hit in hits:
-                kontakt = hit.find("k:Kontakt", ns)
+                kontakt = hit.find(_K["kontakt"])
                 if kontakt is None:
                     continue
-                records.append(_kontakt_record(kontakt, ns))
+                records.append(_kontakt_record(kontakt))
 
             if params.format == "json":
                 return json_out({"total": num_hits, "count": len(records), "members": records})
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
+from itertools import groupby, islice
 
 from mcp.types import ToolAnnotations
 from pydantic import BaseModel, ConfigDict, Field
@@ -35,6 +37,64 @@ from ..formatters import json_out as _json_out
 from ..http_client import ckan_request, http_get_json
 from ..resolver import resolve_yearly_resource
 
+# ParkenDD lot states; "nodata"/"unknown" (and anything new) get a neutral
+# icon rather than reading as closed.
+_PARKING_STATUS_ICONS = {"open": "🟢", "closed": "🔴"}
+
+# Display names and units of the UGZ meteo parameters (see MeteoParameter).
+_WEATHER_PARAM_NAMES = {
+    "T": "🌡️ Temperatur",
+    "Hr": "💧 Luftfeuchte",
+    "p": "📊 Luftdruck",
+    "RainDur": "🌧️ Regendauer",
+    "StrGlo": "☀️ Globalstrahlung",
+    "WD": "🧭 Windrichtung",
+    "WVs": "💨 Windgeschwindigkeit (Skalar)",
+    "WVv": "💨 Windgeschwindigkeit (Vektor)",
+}
+_WEATHER_UNITS = {
+    "T": "°C",
+    "Hr": "%",
+    "p": "hPa",
+    "RainDur": "min",
+    "StrGlo": "W/m²",
+    "WD": "°",
+    "WVs": "m/s",
+    "WVv": "m/s",
+}
+
+# Rows of the Zürichsee station block, in display order: (label, field, unit).
+# Wind speed and gusts share one row and are rendered between the two tables.
+_WATER_FIELDS = (
+    ("🌊 **Wassertemperatur**", "water_temperature", "°C"),
+    ("🌡️ **Lufttemperatur**", "air_temperature", "°C"),
+    ("📊 **Wasserstand**", "water_level", "m ü.M."),
+)
+_WATER_FIELDS_AFTER_WIND = (
+    ("🧭 **Windrichtung**", "wind_direction", "°"),
+    ("💧 **Luftfeuchte**", "humidity", "%"),
+    ("🌧️ **Niederschlag**", "precipitation", "mm"),
+    ("📏 **Luftdruck**", "barometric_pressure_qfe", "hPa"),
+    ("🌡️ **Taupunkt**", "dew_point", "°C"),
+    ("☀️ **Globalstrahlung**", "global_radiation", "W/m²"),
+)
+
+
+def _water_value(record: dict, key: str, unit: str) -> str:
+    """Format a station value with its unit, replacing None with '–'."""
+    val = record.get(key)
+    return f"{val} {unit}".strip() if val is not None else "–"
+
+
+def _datum(record: dict) -> str:
+    """Grouping key for the UGZ series.
+
+    The queries sort by ``Datum desc``, so each timestamp's rows are
+    contiguous and ``groupby`` can stop after the first few timestamps
+    instead of bucketing the whole page.
+    """
+    return record.get("Datum", "?")
+
 
 def _strip_ids(records: list[dict]) -> list[dict]:
     """Drop the CKAN-internal `_id` column from records for JSON output."""
@@ -92,7 +152,7 @@ async def zurich_parking_live(params: ParkingLiveInput | None = None) -> str:
             total = lot.get("total", 0)
             state = lot.get("state", "?")
             pct = round((1 - free / total) * 100) if total > 0 else 0
-            status_icon = "🟢" if state == "open" else "🔴"
+            status_icon = _PARKING_STATUS_ICONS.get(state, "⚪")
             lines.append(f"| {name} | {free} | {total} | {pct}% | {status_icon} {md_cell(state)} |")
 
         lines.append(f"\n**Gesamt**: {len(lots)} Parkhäuser")
@@ -183,12 +243,7 @@ async def zurich_weather_live(params: WeatherLiveInput) -> str:
         lines.append(f"*Quelle: UGZ Messnetz – {result.get('total', '?')} Messwerte total*\n")
 
         # Group by timestamp for better readability
-        by_time: dict[str, list] = {}
-        for r in records:
-            ts = r.get("Datum", "?")
-            by_time.setdefault(ts, []).append(r)
-
-        for ts, measurements in list(by_time.items())[:5]:
+        for ts, measurements in islice(groupby(records, key=_datum), 5):
             lines.append(f"### {ts}")
             for m in measurements:
                 station = m.get("Standort", "?")
@@ -196,28 +251,8 @@ async def zurich_weather_live(params: WeatherLiveInput) -> str:
                 value = m.get("Wert", "?")
                 status = m.get("Status", "")
 
-                # Human-readable parameter names
-                param_names = {
-                    "T": "🌡️ Temperatur",
-                    "Hr": "💧 Luftfeuchte",
-                    "p": "📊 Luftdruck",
-                    "RainDur": "🌧️ Regendauer",
-                    "StrGlo": "☀️ Globalstrahlung",
-                    "WD": "🧭 Windrichtung",
-                    "WVs": "💨 Windgeschwindigkeit (Skalar)",
-                    "WVv": "💨 Windgeschwindigkeit (Vektor)",
-                }
-                display = param_names.get(param, param)
-                unit = {
-                    "T": "°C",
-                    "Hr": "%",
-                    "p": "hPa",
-                    "RainDur": "min",
-                    "StrGlo": "W/m²",
-                    "WD": "°",
-                    "WVs": "m/s",
-                    "WVv": "m/s",
-                }.get(param, "")
+                display = _WEATHER_PARAM_NAMES.get(param, param)
+                unit = _WEATHER_UNITS.get(param, "")
                 status_str = f" ⚠️ {status}" if status and status != "provisorisch" else ""
 
                 lines.append(f"- **{station}** – {display}: **{value} {unit}**{status_str}")
@@ -308,19 +343,13 @@ async def zurich_air_quality(params: AirQualityInput) -> str:
         lines.append(f"*Quelle: UGZ Messnetz – {result.get('total', '?')} Messwerte total*\n")
 
         # Group by timestamp
-        by_time: dict[str, list] = {}
-        for r in records:
-            ts = r.get("Datum", "?")
-            by_time.setdefault(ts, []).append(r)
-
-        for ts, measurements in list(by_time.items())[:3]:
+        for ts, measurements in islice(groupby(records, key=_datum), 3):
             lines.append(f"### {ts}")
 
             # Sub-group by station
-            by_station: dict[str, list] = {}
+            by_station: defaultdict[str, list] = defaultdict(list)
             for m in measurements:
-                st = m.get("Standort", "?")
-                by_station.setdefault(st, []).append(m)
+                by_station[m.get("Standort", "?")].append(m)
 
             for station, meas in by_station.items():
                 values = []
@@ -412,23 +441,16 @@ async def zurich_water_weather(params: WaterWeatherInput) -> str:
             ts = r.get("timestamp_cet", r.get("timestamp_utc", "?"))
             lines.append(f"### {ts}")
 
-            def v(key: str, unit: str = "") -> str:
-                """Format value, replacing None with '–'."""
-                val = r.get(key)
-                return f"{val} {unit}".strip() if val is not None else "–"
-
-            lines.append(f"- 🌊 **Wassertemperatur**: {v('water_temperature', '°C')}")
-            lines.append(f"- 🌡️ **Lufttemperatur**: {v('air_temperature', '°C')}")
-            lines.append(f"- 📊 **Wasserstand**: {v('water_level', 'm ü.M.')}")
-            wind_speed = v("wind_speed_avg_10min", "m/s")
-            wind_gust = v("wind_gust_max_10min", "m/s")
+            lines.extend(
+                f"- {label}: {_water_value(r, key, unit)}" for label, key, unit in _WATER_FIELDS
+            )
+            wind_speed = _water_value(r, "wind_speed_avg_10min", "m/s")
+            wind_gust = _water_value(r, "wind_gust_max_10min", "m/s")
             lines.append(f"- 💨 **Wind**: {wind_speed} (Böen: {wind_gust})")
-            lines.append(f"- 🧭 **Windrichtung**: {v('wind_direction', '°')}")
-            lines.append(f"- 💧 **Luftfeuchte**: {v('humidity', '%')}")
-            lines.append(f"- 🌧️ **Niederschlag**: {v('precipitation', 'mm')}")
-            lines.append(f"- 📏 **Luftdruck**: {v('barometric_pressure_qfe', 'hPa')}")
-            lines.append(f"- 🌡️ **Taupunkt**: {v('dew_point', '°C')}")
-            lines.append(f"- ☀️ **Globalstrahlung**: {v('global_radiation', 'W/m²')}")
+            lines.extend(
+                f"- {label}: {_water_value(r, key, unit)}"
+                for label, key, unit in _WATER_FIELDS_AFTER_WIND
+            )
             lines.append("")
 
         lines.append("---")
@@ -627,7 +649,7 @@ async def zurich_vbz_passengers(params: VBZPassengersInput) -> str:
 
         # Render data
         lines.append("```json")
-        lines.append(json.dumps(records, indent=2, ensure_ascii=False, default=str))
+        lines.append(_json_out(records))
         lines.append("```")
 
         if result.get("total", 0) > params.limit:
@@ -1,13 +1,16 @@
-"""MCP Resource handlers (zurich:// URIs)."""
+"""MCP Resource handlers (zurich:// URIs).
 
-from __future__ import annotations
+Serialised through ``json_out`` like the tools' ``format='json'`` output;
+the GeoJSON resource runs to 500 features, where orjson is far faster.
+"""
 
-import json
+from __future__ import annotations
 
 from ..app import mcp
 from ..clients.tourism import zt_get_categories
-from ..clients.wfs import wfs_get_features
+from ..clients.wfs import wfs_get_layer
 from ..config import GEOPORTAL_LAYERS, PARKENDD_URL
+from ..formatters import json_out
 from ..http_client import ckan_request, http_get_json
 
 
@@ -15,7 +18,7 @@ from ..http_client import ckan_request, http_get_json
 async def get_dataset_resource(name: str) -> str:
     """Datensatz-Metadaten als MCP Resource."""
     result = await ckan_request("package_show", {"id": name})
-    return json.dumps(result, indent=2, ensure_ascii=False, default=str)
+    return json_out(result)
 
 
 @mcp.resource("zurich://category/{group_id}")
@@ -28,28 +31,27 @@ async def get_category_resource(group_id: str) -> str:
             "include_datasets": True,
         },
     )
-    return json.dumps(result, indent=2, ensure_ascii=False, default=str)
+    return json_out(result)
 
 
 @mcp.resource("zurich://parking")
 async def get_parking_resource() -> str:
     """Aktuelle Parkplatz-Daten als MCP Resource."""
     data = await http_get_json(PARKENDD_URL)
-    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    return json_out(data)
 
 
 @mcp.resource("zurich://geo/{layer_id}")
 async def get_geo_resource(layer_id: str) -> str:
     """GeoJSON-Daten eines Geoportal-Layers als MCP Resource."""
     if layer_id not in GEOPORTAL_LAYERS:
-        return json.dumps({"error": f"Unknown layer: {layer_id}"})
-    service_name, typename, _ = GEOPORTAL_LAYERS[layer_id]
-    data = await wfs_get_features(service_name, typename, max_features=500)
-    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+        return json_out({"error": f"Unknown layer: {layer_id}"})
+    data = await wfs_get_layer(layer_id, max_features=500)
+    return json_out(data)
 
 
 @mcp.resource("zurich://tourism/categories")
 async def get_tourism_categories_resource() -> str:
     """Zürich Tourismus Kategorien als MCP Resource."""
     data = await zt_get_categories()
-    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    return json_out(data)
@@ -10,7 +10,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from ..app import mcp
 from ..config import STRB_DEPARTEMENTE, STRB_RESOURCE_ID, OutputFormat
-from ..formatters import handle_api_error
+from ..formatters import handle_api_error, json_out
 from ..http_client import ckan_request
 
 
@@ -205,15 +205,13 @@ async def zurich_strb_search(params: SearchSTRBInput) -> str:
             )
 
         if params.format == "json":
-            return json.dumps(
+            return json_out(
                 {
                     "query": params.query,
                     "total": total,
                     "count": len(records),
                     "beschluesse": [_format_strb_record(r) for r in records],
-                },
-                indent=2,
-                ensure_ascii=False,
+                }
             )
 
         return _format_strb_markdown(records, total, f"Stadtratsbeschlüsse: «{params.query}»")
@@ -329,15 +327,13 @@ async def zurich_strb_by_department(params: BeschluesseDepartementInput) -> str:
             )
 
         if params.format == "json":
-            return json.dumps(
+            return json_out(
                 {
                     "departement_filter": params.departement,
                     "total": total,
                     "count": len(records),
                     "beschluesse": [_format_strb_record(r) for r in records],
-                },
-                indent=2,
-                ensure_ascii=False,
+                }
             )
 
         return _format_strb_markdown(records, total, f"STRB – Departement: {params.departement}")
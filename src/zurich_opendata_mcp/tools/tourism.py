@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from operator import itemgetter
+
+import orjson
 from mcp.types import ToolAnnotations
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -32,6 +37,78 @@ def _tourism_record(item: dict, lang: str) -> dict:
     }
 
 
+# Markdown lines of an entry: label and how to render it from the flat record;
+# a field that renders empty is left out.
+_TOURISM_FIELDS: tuple[tuple[str, Callable[[dict], str]], ...] = (
+    ("Typ", itemgetter("typ")),
+    ("Kategorien", lambda rec: ", ".join(rec["kategorien"][:5])),
+    # The API sends null for a language without a description.
+    ("Beschreibung", lambda rec: (rec["beschreibung"] or "")[:250]),
+    ("Adresse", itemgetter("adresse")),
+    ("Telefon", itemgetter("telefon")),
+    ("Web", itemgetter("web")),
+    ("Koordinaten", lambda rec: f"{rec['lat']}, {rec['lon']}" if rec["lat"] and rec["lon"] else ""),
+)
+
+# Bound on parallel category fetches for "all" / comma lists (12 named
+# categories), below the shared client's keep-alive pool.
+_MAX_CONCURRENT_CATEGORIES = 8
+
+
+def _resolve_category(category: str) -> int | None:
+    """Map a category name or numeric ID onto its ZT ID; None if unknown."""
+    if category.isdigit():
+        return int(category)
+    return ZT_CATEGORIES.get(category.lower())
+
+
+def _item_key(item: dict) -> tuple[str, str] | None:
+    """Identity of a tourism item across categories, or None if it has none.
+
+    The ``@id`` when present, else the names and address: an item tagged with
+    several categories is returned, identical, by each of them.
+    """
+    if item_id := item.get("@id"):
+        return ("@id", str(item_id))
+    if item.get("name") or item.get("address"):
+        names_and_address = [item.get("name"), item.get("address")]
+        return ("name", orjson.dumps(names_and_address, option=orjson.OPT_SORT_KEYS).decode())
+    return None
+
+
+async def _fetch_categories(categories: dict[int, str]) -> tuple[list[dict], list[str]]:
+    """Fetch several categories (ID -> label) concurrently and merge their items.
+
+    Items listed under more than one category are kept once. A failed
+    category only drops its own items and is returned by label alongside;
+    if every one failed, the first error propagates.
+    """
+    sem = asyncio.Semaphore(_MAX_CONCURRENT_CATEGORIES)
+
+    async def one(cat_id: int) -> list[dict]:
+        async with sem:
+            return await zt_get_data(cat_id)
+
+    results = await asyncio.gather(*(one(c) for c in categories), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if len(errors) == len(results):
+        raise errors[0]
+    failed = [
+        label
+        for label, r in zip(categories.values(), results, strict=True)
+        if isinstance(r, BaseException)
+    ]
+    # Dedup in one pass; a dict keeps first-seen order. An item without any
+    # identifying field is kept as is, keyed by its object identity.
+    unique: dict[object, dict] = {}
+    for r in results:
+        if not isinstance(r, BaseException):
+            for item in r:
+                key = _item_key(item)
+                unique.setdefault(id(item) if key is None else key, item)
+    return list(unique.values()), failed
+
+
 class TourismSearchInput(BaseModel):
     """Input für Zürich Tourismus Daten."""
 
@@ -42,7 +119,8 @@ class TourismSearchInput(BaseModel):
         description=(
             "Tourismus-Kategorie. Verfügbar: "
             + ", ".join(f"'{k}'" for k in sorted(ZT_CATEGORIES.keys()))
-            + ". Oder eine numerische Kategorie-ID."
+            + ". Oder eine numerische Kategorie-ID, mehrere durch Komma getrennt "
+            "(z.B. 'museen,kultur'), oder 'all' für alle benannten Kategorien."
         ),
     )
     search_text: str | None = Field(
@@ -78,16 +156,28 @@ async def zurich_tourism(params: TourismSearchInput) -> str:
         Markdown-formatierte Liste der Tourismus-Einträge
     """
     try:
-        # Resolve category
-        if params.category.isdigit():
-            cat_id = int(params.category)
-        elif params.category.lower() in ZT_CATEGORIES:
-            cat_id = ZT_CATEGORIES[params.category.lower()]
+        # Resolve category: one name/ID, a comma list, or "all"
+        if params.category.lower() == "all":
+            categories = {cat_id: name for name, cat_id in ZT_CATEGORIES.items()}
         else:
-            available = ", ".join(f"`{k}` ({v})" for k, v in sorted(ZT_CATEGORIES.items()))
-            return f"Unbekannte Kategorie `{params.category}`. Verfügbar:\n{available}"
-
-        data = await zt_get_data(cat_id)
+            names = [c.strip() for c in params.category.split(",") if c.strip()]
+            resolved = {name: _resolve_category(name) for name in names}
+            unknown = [name for name, cat_id in resolved.items() if cat_id is None]
+            if unknown or not names:
+                available = ", ".join(f"`{k}` ({v})" for k, v in sorted(ZT_CATEGORIES.items()))
+                label = ", ".join(unknown) or params.category
+                return f"Unbekannte Kategorie `{label}`. Verfügbar:\n{available}"
+            # ID -> label as requested; a repeated ID keeps its first label.
+            categories = {}
+            for name, cat_id in resolved.items():
+                if cat_id is not None:
+                    categories.setdefault(cat_id, name)
+
+        failed: list[str] = []
+        if len(categories) == 1:
+            data = await zt_get_data(next(iter(categories)))
+        else:
+            data, failed = await _fetch_categories(categories)
         lang = params.language
 
         # Filter by search text
@@ -97,11 +187,12 @@ async def zurich_tourism(params: TourismSearchInput) -> str:
             for item in data:
                 name = item.get("name", {}).get(lang, "") or ""
                 desc = item.get("disambiguatingDescription", {}).get(lang, "") or ""
-                categories = " ".join(item.get("category", {}).keys())
+                # Category keys are matched one by one, and only when name and
+                # description did not match: no joined string per item.
                 if (
                     search_lower in name.lower()
                     or search_lower in desc.lower()
-                    or search_lower in categories.lower()
+                    or any(search_lower in key.lower() for key in item.get("category", {}))
                 ):
                     filtered.append(item)
             data = filtered
@@ -109,11 +200,16 @@ async def zurich_tourism(params: TourismSearchInput) -> str:
         total = len(data)
         data = data[: params.max_results]
 
+        failed_note = (
+            f"⚠️ Nicht abrufbar (fehlen in der Liste): {', '.join(failed)}" if failed else ""
+        )
+
         if not data:
             return (
                 f"Keine Tourismus-Einträge gefunden für Kategorie '{params.category}'"
                 + (f" mit Filter '{params.search_text}'" if params.search_text else "")
                 + "."
+                + (f"\n{failed_note}" if failed_note else "")
             )
 
         records = [_tourism_record(item, lang) for item in data]
@@ -124,6 +220,7 @@ async def zurich_tourism(params: TourismSearchInput) -> str:
                     "category": params.category,
                     "total": total,
                     "count": len(records),
+                    "failed_categories": failed,
                     "eintraege": records,
                 }
             )
@@ -132,23 +229,16 @@ async def zurich_tourism(params: TourismSearchInput) -> str:
             f"## Zürich Tourismus: {params.category}",
             f"**{total} Einträge** (zeige {len(records)})\n",
         ]
+        if failed_note:
+            lines.append(f"{failed_note}\n")
 
         for rec in records:
             lines.append(f"### {rec['name']}")
-            if rec["typ"]:
-                lines.append(f"- **Typ**: {rec['typ']}")
-            if rec["kategorien"]:
-                lines.append(f"- **Kategorien**: {', '.join(rec['kategorien'][:5])}")
-            if rec["beschreibung"]:
-                lines.append(f"- **Beschreibung**: {rec['beschreibung'][:250]}")
-            if rec["adresse"]:
-                lines.append(f"- **Adresse**: {rec['adresse']}")
-            if rec["telefon"]:
-                lines.append(f"- **Telefon**: {rec['telefon']}")
-            if rec["web"]:
-                lines.append(f"- **Web**: {rec['web']}")
-            if rec["lat"] and rec["lon"]:
-                lines.append(f"- **Koordinaten**: {rec['lat']}, {rec['lon']}")
+            lines.extend(
+                f"- **{label}**: {value}"
+                for label, render in _TOURISM_FIELDS
+                if (value := render(rec))
+            )
             lines.append("")
 
         return "\n".join(lines)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from zurich_opendata_mcp import retry
+from zurich_opendata_mcp import cache, retry
 
 
 @pytest.fixture(autouse=True)
@@ -23,3 +23,15 @@ def _no_retry_backoff(monkeypatch):
         return None
 
     monkeypatch.setattr(retry, "_sleep", _instant)
+
+
+@pytest.fixture(autouse=True)
+def _empty_response_cache():
+    """Start every test with an empty response cache.
+
+    Tests mock the same upstream URLs with different answers; an entry left
+    over from an earlier test would answer in place of the mock.
+    """
+    cache.clear_cache()
+    yield
+    cache.clear_cache()
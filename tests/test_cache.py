@@ -0,0 +1,276 @@
+"""Tests for the response cache (cache.cached): hits, expiry, stale fallback."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from zurich_opendata_mcp import cache, http_client
+from zurich_opendata_mcp.config import CKAN_API_URL
+from zurich_opendata_mcp.retry import UpstreamUnavailableError
+
+_GROUP_LIST = f"{CKAN_API_URL}/group_list"
+
+
+@pytest.fixture(autouse=True)
+async def _reset_shared_client():
+    await http_client.close_client()
+    yield
+    await http_client.close_client()
+
+
+def _ckan(result) -> httpx.Response:
+    return httpx.Response(200, json={"success": True, "result": result})
+
+
+def _expire_all() -> None:
+    for key, (value, _, fetched) in cache._cache.items():
+        cache._cache[key] = (value, 0.0, fetched)
+
+
+@respx.mock
+async def test_repeat_call_is_answered_from_cache():
+    route = respx.get(_GROUP_LIST).mock(return_value=_ckan(["umwelt"]))
+
+    assert await http_client.ckan_request("group_list") == ["umwelt"]
+    assert await http_client.ckan_request("group_list") == ["umwelt"]
+
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_params_are_part_of_the_key_in_any_order():
+    route = respx.get(f"{CKAN_API_URL}/package_search").mock(return_value=_ckan({"count": 0}))
+
+    await http_client.ckan_request("package_search", {"q": "a", "rows": 5})
+    await http_client.ckan_request("package_search", {"rows": 5, "q": "a"})
+    assert route.call_count == 1
+
+    await http_client.ckan_request("package_search", {"q": "b", "rows": 5})
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_expired_entry_refetches():
+    route = respx.get(_GROUP_LIST).mock(side_effect=[_ckan(["old"]), _ckan(["new"])])
+
+    await http_client.ckan_request("group_list")
+    _expire_all()
+
+    assert await http_client.ckan_request("group_list") == ["new"]
+    assert route.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [httpx.Response(503), httpx.Response(429), httpx.ConnectError("down")],
+)
+@respx.mock
+async def test_unavailable_upstream_serves_the_stale_entry(failure):
+    respx.get(_GROUP_LIST).mock(side_effect=[_ckan(["old"]), failure, failure, failure, failure])
+
+    await http_client.ckan_request("group_list")
+    _expire_all()
+
+    assert await http_client.ckan_request("group_list") == ["old"]
+
+
+@respx.mock
+async def test_spent_budget_serves_the_stale_entry(monkeypatch):
+    respx.get(_GROUP_LIST).mock(return_value=_ckan(["old"]))
+    await http_client.ckan_request("group_list")
+    _expire_all()
+
+    async def _no_budget(*_args, **_kwargs):
+        raise UpstreamUnavailableError("no attempt made")
+
+    monkeypatch.setattr(http_client, "fetch_with_retry", _no_budget)
+
+    assert await http_client.ckan_request("group_list") == ["old"]
+
+
+@respx.mock
+async def test_request_error_is_not_covered_by_the_stale_entry():
+    """A 404 is a statement about the request — an old answer must not hide it."""
+    respx.get(_GROUP_LIST).mock(side_effect=[_ckan(["old"]), httpx.Response(404)])
+
+    await http_client.ckan_request("group_list")
+    _expire_all()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await http_client.ckan_request("group_list")
+
+
+@respx.mock
+async def test_failure_without_entry_propagates_and_is_not_cached():
+    route = respx.get(_GROUP_LIST).mock(
+        side_effect=[httpx.ConnectError("down")] * 4 + [_ckan(["ok"])]
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        await http_client.ckan_request("group_list")
+
+    assert await http_client.ckan_request("group_list") == ["ok"]
+    assert route.call_count == 5
+
+
+@respx.mock
+async def test_concurrent_identical_calls_share_one_fetch():
+    async def slow(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return _ckan(["umwelt"])
+
+    route = respx.get(_GROUP_LIST).mock(side_effect=slow)
+
+    results = await asyncio.gather(*(http_client.ckan_request("group_list") for _ in range(5)))
+
+    assert results == [["umwelt"]] * 5
+    assert route.call_count == 1
+    assert cache.cache_stats()["coalesced"] == 4
+
+
+@respx.mock
+async def test_cancelled_caller_does_not_cancel_the_shared_fetch():
+    release = asyncio.Event()
+
+    async def held(_request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return _ckan(["umwelt"])
+
+    respx.get(_GROUP_LIST).mock(side_effect=held)
+
+    first = asyncio.ensure_future(http_client.ckan_request("group_list"))
+    second = asyncio.ensure_future(http_client.ckan_request("group_list"))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == ["umwelt"]
+
+
+@respx.mock
+async def test_least_recently_used_entry_is_evicted(monkeypatch):
+    monkeypatch.setattr(cache, "MAX_ENTRIES", 2)
+    route = respx.get(f"{CKAN_API_URL}/package_show").mock(return_value=_ckan({}))
+
+    await http_client.ckan_request("package_show", {"id": "a"})
+    await http_client.ckan_request("package_show", {"id": "b"})
+    await http_client.ckan_request("package_show", {"id": "a"})  # a is now most recent
+    await http_client.ckan_request("package_show", {"id": "c"})  # evicts b
+
+    await http_client.ckan_request("package_show", {"id": "a"})
+    assert route.call_count == 3
+    await http_client.ckan_request("package_show", {"id": "b"})
+    assert route.call_count == 4
+
+    stats = cache.cache_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 2
+    assert stats["hits"] == 2
+
+
+@respx.mock
+async def test_ttl_follows_the_ckan_action():
+    respx.get(_GROUP_LIST).mock(return_value=_ckan([]))
+    respx.get(f"{CKAN_API_URL}/datastore_search").mock(return_value=_ckan({}))
+
+    await http_client.ckan_request("group_list")
+    await http_client.ckan_request("datastore_search", {"resource_id": "r"})
+    # limit=0 is a schema probe and lives as long as the group list.
+    await http_client.ckan_request("datastore_search", {"resource_id": "r", "limit": 0})
+
+    lifetimes = sorted(expiry - fetched for _, expiry, fetched in cache._cache.values())
+    assert lifetimes == pytest.approx([30, cache.TTL_LONG, cache.TTL_LONG])
+
+
+def _expire_all_just_now() -> None:
+    now = time.monotonic()
+    for key, (value, _, fetched) in cache._cache.items():
+        cache._cache[key] = (value, now - 1, fetched)
+
+
+@respx.mock
+async def test_entry_inside_the_revalidate_window_is_served_and_refreshed():
+    route = respx.get(_GROUP_LIST).mock(side_effect=[_ckan(["old"]), _ckan(["new"])])
+
+    await http_client.ckan_request("group_list")
+    _expire_all_just_now()
+
+    # Answered from the expired entry at once; the refetch runs behind it.
+    assert await http_client.ckan_request("group_list") == ["old"]
+    assert await http_client.ckan_request("group_list") == ["old"]
+    await asyncio.gather(*cache._inflight.values())
+
+    assert await http_client.ckan_request("group_list") == ["new"]
+    assert route.call_count == 2
+    assert cache.cache_stats()["revalidations"] == 2
+
+
+@respx.mock
+async def test_unavailable_background_refresh_keeps_the_entry():
+    respx.get(_GROUP_LIST).mock(
+        side_effect=[_ckan(["old"]), *[httpx.Response(503)] * 4, _ckan(["new"])]
+    )
+
+    await http_client.ckan_request("group_list")
+    _expire_all_just_now()
+
+    assert await http_client.ckan_request("group_list") == ["old"]
+    await asyncio.gather(*cache._inflight.values(), return_exceptions=True)
+
+    # The failure was not stored: the entry is still served, and refreshed again.
+    assert await http_client.ckan_request("group_list") == ["old"]
+    await asyncio.gather(*cache._inflight.values())
+    assert await http_client.ckan_request("group_list") == ["new"]
+
+
+@respx.mock
+async def test_rejected_background_refresh_evicts_the_entry():
+    """A 404 is a statement about the request — the next call must see it."""
+    respx.get(_GROUP_LIST).mock(
+        side_effect=[_ckan(["old"]), httpx.Response(404), httpx.Response(404)]
+    )
+
+    await http_client.ckan_request("group_list")
+    _expire_all_just_now()
+
+    assert await http_client.ckan_request("group_list") == ["old"]
+    await asyncio.gather(*cache._inflight.values(), return_exceptions=True)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await http_client.ckan_request("group_list")
+
+
+async def test_max_entries_caps_one_function_only():
+    @cache.cached(60, max_entries=2)
+    async def big(n: int) -> int:
+        return n
+
+    @cache.cached(60)
+    async def small(n: int) -> int:
+        return n
+
+    for n in range(4):
+        await small(n)
+        await big(n)
+
+    keys = list(cache._cache)
+    assert sum("big[" in k for k in keys) == 2
+    assert sum("small[" in k for k in keys) == 4
+    assert cache.cache_stats()["evictions"] == 2
+
+
+async def test_max_entries_holds_up_to_its_cap():
+    @cache.cached(60, max_entries=4)
+    async def big(n: int) -> int:
+        return n
+
+    for n in range(4):
+        await big(n)
+
+    assert sum("big[" in k for k in cache._cache) == 4
+    assert cache.cache_stats()["evictions"] == 0
@@ -7,6 +7,8 @@ list_categories, list_tags, catalog_stats and find_school_data.
 
 from __future__ import annotations
 
+import json
+
 import httpx
 import respx
 from fixture_data import fixture_json
@@ -165,6 +167,45 @@ async def test_find_school_data_groups_by_author():
     assert "Bevölkerung" in result
 
 
+@respx.mock
+async def test_find_school_data_caps_both_lists():
+    schulamt = [{"name": f"ssd_{i}", "title": f"SSD {i}", "author": "Schulamt"} for i in range(12)]
+    other = [{"name": f"o_{i}", "title": f"Other {i}", "author": "Statistik"} for i in range(17)]
+    respx.get(_SEARCH).mock(return_value=_ckan({"count": 29, "results": schulamt + other}))
+
+    result = await zurich_find_school_data(FindSchoolDataInput())
+
+    assert "**29 Treffer** (zeige 25)" in result
+    assert "SSD 9" in result and "SSD 10" not in result
+    assert "*… und 2 weitere*" in result
+    assert "- **Other 14** (`o_14`) – Statistik" in result
+    assert "Other 15" not in result
+
+
+@respx.mock
+async def test_find_school_data_survives_a_failed_term():
+    ok = _ckan({"count": 1, "results": [{"name": "a", "title": "Alpha", "author": "X"}]})
+    respx.get(_SEARCH, params={"q": "Schule"}).mock(return_value=httpx.Response(404))
+    respx.get(_SEARCH).mock(return_value=ok)
+
+    result = await zurich_find_school_data(FindSchoolDataInput())
+    payload = json.loads(await zurich_find_school_data(FindSchoolDataInput(format="json")))
+
+    assert "Alpha" in result
+    assert "Suche fehlgeschlagen für: Schule" in result
+    assert payload["failed_terms"] == ["Schule"]
+    assert [ds["id"] for ds in payload["weitere"]] == ["a"]
+
+
+@respx.mock
+async def test_find_school_data_reports_when_every_term_fails():
+    respx.get(_SEARCH).mock(return_value=httpx.Response(404))
+
+    result = await zurich_find_school_data(FindSchoolDataInput())
+
+    assert "Fehler bei Schuldaten-Suche" in result
+
+
 @respx.mock
 async def test_find_school_data_with_topic():
     respx.get(f"{CKAN_API_URL}/package_search").mock(
@@ -16,6 +16,7 @@ from zurich_opendata_mcp.config import GEOPORTAL_LAYERS, WFS_BASE_URL
 from zurich_opendata_mcp.tools.geo import (
     GeoFeaturesInput,
     GeoLayersInput,
+    _validate_cql_filter,
     zurich_geo_features,
     zurich_geo_layers,
 )
@@ -99,6 +100,32 @@ async def test_geo_features_passes_cql_filter():
     assert "**Filter**: `kategorie = 'Kindergarten'`" in result
 
 
+def test_cql_gate_accepts_balanced_filters():
+    assert _validate_cql_filter("kategorie = 'Kindergarten'") is None
+    # Doubled quote is an escaped quote inside one literal; parens in a
+    # literal do not count.
+    assert _validate_cql_filter("name = 'Schulhaus ''A'' (alt)'") is None
+    assert _validate_cql_filter("(a = 1 OR b = 2) AND c LIKE '%x%'") is None
+
+
+def test_cql_gate_rejects_malformed_filters():
+    assert "Literal" in _validate_cql_filter("name = 'Wasser")
+    assert "Klammern" in _validate_cql_filter("(a = 1")
+    assert "Klammern" in _validate_cql_filter("a = 1) AND (b = 2")
+
+
+@respx.mock
+async def test_geo_features_rejects_malformed_cql_without_a_request():
+    route = respx.get(_WFS_URL).mock(return_value=httpx.Response(200, json={"features": []}))
+
+    result = await zurich_geo_features(
+        GeoFeaturesInput(layer_id="schulanlagen", property_filter="name = 'Wasser")
+    )
+
+    assert result.startswith("Fehler: CQL-Filter")
+    assert not route.called
+
+
 @respx.mock
 async def test_geo_features_truncates_after_20():
     feats = [_point(f"P{i}", 8.5, 47.3) for i in range(21)]
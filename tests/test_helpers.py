@@ -73,6 +73,20 @@ async def test_ckan_request_raises_on_unsuccessful_response():
         await ckan_request("package_show", {"id": "x"})
 
 
+# ─── formatters.json_out ─────────────────────────────────────────────────────
+
+
+def test_json_out_keeps_umlauts_and_stringifies_the_rest():
+    from datetime import date
+    from decimal import Decimal
+
+    from zurich_opendata_mcp.formatters import json_out
+
+    out = json_out({"Ort": "Zürich", 2024: Decimal("1.5"), "am": date(2026, 1, 2)})
+
+    assert out == '{\n  "Ort": "Zürich",\n  "2024": "1.5",\n  "am": "2026-01-02"\n}'
+
+
 # ─── clients/paris.paris_extract_text default ────────────────────────────────
 
 
@@ -86,6 +100,22 @@ def test_paris_extract_text_defaults():
     assert paris_extract_text(ET.Element("x"), "fallback") == "fallback"
 
 
+def test_paris_path_matches_prefixed_lookup():
+    import xml.etree.ElementTree as ET
+
+    from zurich_opendata_mcp.clients.paris import paris_path
+    from zurich_opendata_mcp.config import PARIS_NAMESPACES
+
+    g = PARIS_NAMESPACES["g"]
+    root = ET.fromstring(f'<r xmlns:g="{g}"><g:Beginn><g:Text>2024</g:Text></g:Beginn></r>')
+
+    path = paris_path("g:Beginn/g:Text")
+    assert path == f"{{{g}}}Beginn/{{{g}}}Text"
+    assert root.find(path) is root.find("g:Beginn/g:Text", PARIS_NAMESPACES)
+    # Unprefixed steps pass through untouched.
+    assert paris_path("./x") == "./x"
+
+
 # ─── server.main() CLI wiring ────────────────────────────────────────────────
 
 
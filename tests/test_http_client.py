@@ -10,6 +10,7 @@ import pytest
 import respx
 
 from zurich_opendata_mcp import http_client
+from zurich_opendata_mcp.config import CONNECT_TIMEOUT, REQUEST_TIMEOUT
 
 
 @pytest.fixture(autouse=True)
@@ -64,6 +65,39 @@ def test_get_client_recreates_after_loop_change():
     assert first is not second
 
 
+async def test_pool_limits_reach_the_transport():
+    """httpx drops a client-level `limits=` once a transport is passed, so the
+    limits only count if they sit on the transport's connection pool."""
+    pool = http_client.get_client()._transport._pool
+
+    assert pool._max_keepalive_connections == http_client.POOL_LIMITS.max_keepalive_connections
+    assert pool._max_connections == http_client.POOL_LIMITS.max_connections
+    assert pool._keepalive_expiry == http_client.POOL_LIMITS.keepalive_expiry
+
+
+async def test_shared_client_offers_http2():
+    """Requires the `h2` package (the `httpx[http2]` extra) at runtime."""
+    pool = http_client.get_client()._transport._pool
+
+    assert pool._http2 is True
+
+
+async def test_connect_timeout_is_shorter_than_the_operation_timeout():
+    timeout = http_client.get_client().timeout
+
+    assert timeout.connect == CONNECT_TIMEOUT
+    assert timeout.read == REQUEST_TIMEOUT
+
+
+@respx.mock
+async def test_shared_client_asks_for_gzip():
+    route = respx.get("https://example.test/x").mock(return_value=httpx.Response(200))
+
+    await http_client.http_get("https://example.test/x")
+
+    assert "gzip" in route.calls.last.request.headers["accept-encoding"]
+
+
 async def test_lifespan_closes_shared_client():
     from zurich_opendata_mcp.app import _lifespan, mcp
 
@@ -108,3 +142,42 @@ async def test_http_get_raises_status_error_for_a_deterministic_answer():
         await http_client.http_get("https://example.test/x")
 
     assert route.call_count == 1
+
+
+@respx.mock
+async def test_http_get_json_decodes_utf8_body():
+    respx.get("https://example.test/x").mock(
+        return_value=httpx.Response(200, json={"name": "Zürich", "coords": [8.54, 47.37]})
+    )
+
+    data = await http_client.http_get_json("https://example.test/x")
+
+    assert data == {"name": "Zürich", "coords": [8.54, 47.37]}
+
+
+# ─── ckan_batch ──────────────────────────────────────────────────────────────
+
+
+@respx.mock
+async def test_ckan_batch_keeps_order_and_bounds_concurrency():
+    from zurich_opendata_mcp.config import CKAN_API_URL
+
+    in_flight = 0
+    peak = 0
+
+    async def answer(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        group = request.url.params["id"]
+        return httpx.Response(200, json={"success": True, "result": {"name": group}})
+
+    respx.get(f"{CKAN_API_URL}/group_show").mock(side_effect=answer)
+    ids = [f"g{i}" for i in range(7)]
+
+    results = await http_client.ckan_batch("group_show", [{"id": g} for g in ids], concurrency=3)
+
+    assert [r["name"] for r in results] == ids
+    assert peak == 3
@@ -81,6 +81,17 @@ async def test_parliament_search_renders_hit():
     assert "2 weitere Treffer" in result
 
 
+@respx.mock
+async def test_parliament_search_repeat_is_served_from_cache():
+    route = respx.get(_url("geschaeft")).mock(return_value=_response(1, _GESCHAEFT_HIT))
+
+    first = await zurich_parliament_search(ParliamentSearchInput(query="Schule"))
+    second = await zurich_parliament_search(ParliamentSearchInput(query="Schule"))
+
+    assert first == second
+    assert route.call_count == 1
+
+
 @respx.mock
 async def test_parliament_search_empty():
     respx.get(_url("geschaeft")).mock(return_value=_response(0, ""))
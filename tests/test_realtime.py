@@ -90,6 +90,7 @@ async def test_parking_live_renders_table_sorted():
                 "lots": [
                     {"name": "Urania", "free": 50, "total": 100, "state": "open"},
                     {"name": "Akku", "free": 0, "total": 200, "state": "closed"},
+                    {"name": "Zentrum", "free": 0, "total": 0, "state": "nodata"},
                 ],
             },
         )
@@ -104,7 +105,9 @@ async def test_parking_live_renders_table_sorted():
     # 50/100 free → 50% occupied; open → green icon.
     assert "| Urania | 50 | 100 | 50% | 🟢 open |" in result
     assert "| Akku | 0 | 200 | 100% | 🔴 closed |" in result
-    assert "**Gesamt**: 2 Parkhäuser" in result
+    # No data is not the same as closed.
+    assert "| Zentrum | 0 | 0 | 0% | ⚪ nodata |" in result
+    assert "**Gesamt**: 3 Parkhäuser" in result
 
 
 @respx.mock
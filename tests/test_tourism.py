@@ -85,6 +85,41 @@ async def test_tourism_search_text_filters():
     assert "Steakhouse" not in result
 
 
+@respx.mock
+async def test_tourism_search_text_matches_within_one_category():
+    respx.get(ZT_API_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json=[
+                _item("Zunfthaus", categories=("Altstadt", "Bar")),
+                _item("Seebad", categories=("Sommer",)),
+            ],
+        )
+    )
+
+    hit = await zurich_tourism(TourismSearchInput(category="restaurants", search_text="altst"))
+    # "Altstadt Bar" is two categories, not one that contains the text.
+    miss = await zurich_tourism(
+        TourismSearchInput(category="restaurants", search_text="altstadt bar")
+    )
+
+    assert "Zunfthaus" in hit
+    assert "Seebad" not in hit
+    assert "Keine Tourismus-Einträge gefunden" in miss
+
+
+@respx.mock
+async def test_tourism_null_description_is_skipped():
+    item = _item("Kornhaus")
+    item["disambiguatingDescription"] = {"de": None}
+    respx.get(ZT_API_URL).mock(return_value=httpx.Response(200, json=[item]))
+
+    result = await zurich_tourism(TourismSearchInput(category="restaurants"))
+
+    assert "### Kornhaus" in result
+    assert "Beschreibung" not in result
+
+
 @respx.mock
 async def test_tourism_language_selection():
     respx.get(ZT_API_URL).mock(
@@ -161,3 +196,96 @@ async def test_tourism_json_format():
     assert rec["typ"] == "Restaurant"
     assert rec["adresse"] == "Bahnhofstrasse 1, 8001 Zürich"
     assert rec["lat"] == 47.37
+
+
+@respx.mock
+async def test_tourism_comma_list_fetches_each_category():
+    def by_id(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[_item(f"Ort {request.url.params['id']}")])
+
+    route = respx.get(ZT_API_URL).mock(side_effect=by_id)
+
+    result = await zurich_tourism(TourismSearchInput(category="museen, kultur,museen"))
+
+    assert route.call_count == 2
+    assert f"### Ort {ZT_CATEGORIES['museen']}" in result
+    assert f"### Ort {ZT_CATEGORIES['kultur']}" in result
+    assert "**2 Einträge**" in result
+
+
+@respx.mock
+async def test_tourism_all_names_a_failed_category():
+    def by_id(request: httpx.Request) -> httpx.Response:
+        cat_id = request.url.params["id"]
+        if cat_id == str(ZT_CATEGORIES["events"]):
+            return httpx.Response(404)
+        return httpx.Response(200, json=[_item(f"Ort {cat_id}")])
+
+    route = respx.get(ZT_API_URL).mock(side_effect=by_id)
+
+    result = await zurich_tourism(TourismSearchInput(category="all", max_results=50))
+    assert route.call_count == len(ZT_CATEGORIES)
+
+    # Every category that answered is still cached: a repeat only retries events.
+    await zurich_tourism(TourismSearchInput(category="all", max_results=50))
+    assert route.call_count == len(ZT_CATEGORIES) + 1
+
+    as_json = json.loads(
+        await zurich_tourism(TourismSearchInput(category="all", max_results=50, format="json"))
+    )
+
+    assert f"**{len(ZT_CATEGORIES) - 1} Einträge**" in result
+    assert "Nicht abrufbar (fehlen in der Liste): events" in result
+    assert as_json["failed_categories"] == ["events"]
+
+
+@respx.mock
+async def test_tourism_item_in_several_categories_is_listed_once():
+    shared = _item("Landesmuseum")
+    respx.get(ZT_API_URL).mock(
+        side_effect=lambda request: httpx.Response(
+            200,
+            json=[shared, {**_item("Rietberg"), "@id": request.url.params["id"]}],
+        )
+    )
+
+    result = await zurich_tourism(TourismSearchInput(category="museen,kultur"))
+
+    assert result.count("### Landesmuseum") == 1
+    assert result.count("### Rietberg") == 2  # distinct @id per category
+    assert "**3 Einträge**" in result
+    assert "Nicht abrufbar" not in result
+
+
+@respx.mock
+async def test_tourism_all_failing_reports_the_error():
+    respx.get(ZT_API_URL).mock(return_value=httpx.Response(404))
+
+    result = await zurich_tourism(TourismSearchInput(category="museen,kultur"))
+
+    assert "Fehler bei Zürich Tourismus" in result
+
+
+@respx.mock
+async def test_tourism_items_without_identity_are_not_merged():
+    respx.get(ZT_API_URL).mock(
+        return_value=httpx.Response(200, json=[{"@type": "Place"}, {"@type": "Place"}])
+    )
+
+    result = await zurich_tourism(TourismSearchInput(category="museen,kultur"))
+
+    assert "**4 Einträge**" in result
+
+
+async def test_tourism_unknown_name_in_list_no_http_call():
+    with respx.mock:
+        result = await zurich_tourism(TourismSearchInput(category="museen,raumschiff"))
+
+    assert "Unbekannte Kategorie `raumschiff`" in result
+
+
+async def test_tourism_empty_list_is_unknown():
+    with respx.mock:
+        result = await zurich_tourism(TourismSearchInput(category=" , "))
+
+    assert "Unbekannte Kategorie" in result